@@ -5,6 +5,7 @@ import re
 import shlex
 import sys
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
@@ -44,6 +45,11 @@ def validate_dict_parameter(param_name: str, param: Dict[str, str]) -> None:
         raise AttributeError(f"ApplicationDefinition optional parameter {param_name} must set a 'default' str value")
 
 
+@lru_cache(256)
+def compile_template(command_template: str) -> jinja2.Template:
+    return jinja2.Template(command_template)
+
+
 def detect_template_parameters(command_template: str) -> Set[str]:
     ctx = jinja2.Environment().parse(command_template)
     detected_params: Set[str] = jinja2.meta.find_undeclared_variables(ctx)
@@ -270,7 +276,7 @@ class ApplicationDefinition(metaclass=ApplicationDefinitionMeta):
             raise ValueError(f"Missing required args: {diff} (only got: {arg_dict})")
 
         sanitized_args = {key: shlex.quote(str(arg_dict[key])) for key in self.parameters}
-        return jinja2.Template(self.command_template).render(sanitized_args)
+        return compile_template(self.command_template).render(sanitized_args)
 
     def preprocess(self) -> None:
         self.job.state
@@ -328,21 +334,30 @@ class ApplicationDefinition(metaclass=ApplicationDefinitionMeta):
         api_apps = AppModel.objects.filter(**lookup)  # type: ignore
         apps_by_name = {}
         for app in api_apps:
-            apps_by_name[app.name] = ApplicationDefinition.from_serialized(app)
-            assert app.id is not None
-            ApplicationDefinition._app_id_cache[app.id] = apps_by_name[app.name]
+            apps_by_name[app.name] = ApplicationDefinition._load_api_app(app)
         return apps_by_name
 
+    @classmethod
+    def _load_api_app(cls, app: "App") -> AppDefType:
+        """
+        Deserialize an App fetched from the API, reusing the cached class when
+        its serialized payload is unchanged.
+        """
+        assert app.id is not None
+        cached = cls._app_id_cache.get(app.id)
+        if cached is not None and cached._serialized_class == app.serialized_class:
+            return cached
+        app_def = cls.from_serialized(app)
+        cls._app_id_cache[app.id] = app_def
+        return app_def
+
     @classmethod
     def load_by_name(cls, app_name: str, site_name: Optional[str] = None) -> AppDefType:
         app_key = (site_name, app_name)
         if app_key not in cls._app_name_cache:
             logger.debug(f"App Cache miss: fetching app {app_key}")
             app: "App" = cls._App.objects.get(site_name=site_name, name=app_name)
-            assert app.id is not None
-            app_def = cls.from_serialized(app)
-            cls._app_name_cache[app_key] = app_def
-            cls._app_id_cache[app.id] = app_def
+            cls._app_name_cache[app_key] = cls._load_api_app(app)
         return cls._app_name_cache[app_key]
 
     @classmethod
@@ -350,8 +365,7 @@ class ApplicationDefinition(metaclass=ApplicationDefinitionMeta):
         if app_id not in cls._app_id_cache:
             logger.debug(f"App Cache miss: fetching app {app_id}")
             api_app: "App" = cls._App.objects.get(id=app_id)
-            app_def = cls.from_serialized(api_app)
-            cls._app_id_cache[app_id] = app_def
+            cls._load_api_app(api_app)
         return cls._app_id_cache[app_id]
 
     @classmethod
@@ -1,8 +1,27 @@
 import concurrent.futures
 import logging
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Set, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Type,
+    Union,
+    overload,
+)
+
+from pydantic.datetime_parse import parse_datetime
 
 from balsam import schemas
 from balsam.schemas import JobState, deserialize, raise_from_serialized, serialize
@@ -52,6 +71,31 @@ class AppManagerBase(Manager["App"]):
     _api_path = "apps/"
 
 
+@dataclass(frozen=True)
+class BatchJobValidationCtx:
+    """
+    Site submission policy for `BatchJob.validate`. Build once with
+    `from_site_settings` and reuse it when validating many BatchJobs.
+    """
+
+    queues: Mapping[str, schemas.AllowedQueue]
+    projects: FrozenSet[str]
+    extras: FrozenSet[str]
+
+    @classmethod
+    def from_site_settings(
+        cls,
+        allowed_queues: Mapping[str, schemas.AllowedQueue],
+        allowed_projects: Iterable[str],
+        optional_batch_job_params: Mapping[str, str],
+    ) -> "BatchJobValidationCtx":
+        return cls(
+            queues=allowed_queues,
+            projects=frozenset(allowed_projects),
+            extras=frozenset(optional_batch_job_params),
+        )
+
+
 class BatchJobBase(CreatableBalsamModel):
     _create_model_cls = schemas.BatchJobCreate
     _update_model_cls = schemas.BatchJobUpdate
@@ -65,15 +109,40 @@ class BatchJobBase(CreatableBalsamModel):
     partitions: Field[Optional[List[schemas.BatchJobPartition]]]
     optional_params: Field[Dict[str, str]]
 
+    @overload
+    def validate(self, __ctx: BatchJobValidationCtx) -> None:
+        ...
+
+    @overload
     def validate(
         self,
-        allowed_queues: Dict[str, schemas.AllowedQueue],
-        allowed_projects: List[str],
-        optional_batch_job_params: Dict[str, str],
+        allowed_queues: Mapping[str, schemas.AllowedQueue],
+        allowed_projects: Iterable[str],
+        optional_batch_job_params: Mapping[str, str],
     ) -> None:
-        if self.queue not in allowed_queues:
-            raise ValueError(f"Unknown queue {self.queue} " f"(known: {list(allowed_queues.keys())})")
-        queue = allowed_queues[self.queue]
+        ...
+
+    def validate(
+        self,
+        allowed_queues: Union[BatchJobValidationCtx, Mapping[str, schemas.AllowedQueue]],
+        allowed_projects: Optional[Iterable[str]] = None,
+        optional_batch_job_params: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Check this BatchJob against the Site policy, given either a
+        BatchJobValidationCtx or the three Site settings it is built from.
+        """
+        if isinstance(allowed_queues, BatchJobValidationCtx):
+            ctx = allowed_queues
+        else:
+            assert allowed_projects is not None and optional_batch_job_params is not None
+            ctx = BatchJobValidationCtx.from_site_settings(
+                allowed_queues, allowed_projects, optional_batch_job_params
+            )
+
+        if self.queue not in ctx.queues:
+            raise ValueError(f"Unknown queue {self.queue} " f"(known: {list(ctx.queues.keys())})")
+        queue = ctx.queues[self.queue]
         if self.num_nodes > queue.max_nodes:
             raise ValueError(f"{self.num_nodes} exceeds queue max num_nodes {queue.max_nodes}")
         if self.num_nodes < 1:
@@ -81,30 +150,28 @@ class BatchJobBase(CreatableBalsamModel):
         if self.wall_time_min > queue.max_walltime:
             raise ValueError(f"{self.wall_time_min} exceeds queue max wall_time_min {queue.max_walltime}")
 
-        if self.project not in allowed_projects:
-            raise ValueError(f"Unknown project {self.project} " f"(known: {allowed_projects})")
+        if self.project not in ctx.projects:
+            raise ValueError(f"Unknown project {self.project} " f"(known: {sorted(ctx.projects)})")
         if self.partitions:
             if sum(part.num_nodes for part in self.partitions) != self.num_nodes:
                 raise ValueError("Sum of partition sizes must equal batchjob num_nodes")
 
-        extras = set(self.optional_params.keys())
-        allowed_extras = set(optional_batch_job_params.keys())
-        extraneous = extras.difference(allowed_extras)
+        extraneous = self.optional_params.keys() - ctx.extras
         if extraneous:
-            raise ValueError(f"Extraneous optional_params: {extraneous} " f"(allowed extras: {allowed_extras})")
+            raise ValueError(f"Extraneous optional_params: {extraneous} " f"(allowed extras: {set(ctx.extras)})")
 
     def partitions_to_cli_args(self) -> str:
         if not self.partitions:
             return ""
-        args = ""
+        args = []
         for part in self.partitions:
             job_mode = part.job_mode
             num_nodes = part.num_nodes
             filter_tags = ":".join(f"{k}={v}" for k, v in part.filter_tags.items())
-            args += f" --part {job_mode}:{num_nodes}"
+            args.append(f" --part {job_mode}:{num_nodes}")
             if filter_tags:
-                args += f":{filter_tags}"
-        return args
+                args.append(f":{filter_tags}")
+        return "".join(args)
 
 
 class BatchJobManagerBase(Manager["BatchJob"]):
@@ -137,6 +204,16 @@ class JobBase(CreatableBalsamModel):
         app_id = self._resolve_app_id(app_id, site_name)
         super().__init__(**kwargs, app_id=app_id)
 
+    @classmethod
+    def _coerce_api_data(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **data,
+            "workdir": Path(data["workdir"]),
+            "parent_ids": set(data["parent_ids"]),
+            "state": JobState(data["state"]),
+            "last_update": parse_datetime(data["last_update"]),
+        }
+
     @classmethod
     def _resolve_app_id(cls, app: InputAppType, site_name: Optional[str]) -> int:
         if isinstance(app, int):
@@ -371,7 +448,7 @@ class SessionBase(CreatableBalsamModel):
         max_aggregate_nodes: Optional[float] = None,
         serial_only: bool = False,
         filter_tags: Optional[Dict[str, str]] = None,
-        states: Set[JobState] = RUNNABLE_STATES,
+        states: AbstractSet[JobState] = RUNNABLE_STATES,
         app_ids: Optional[Set[int]] = None,
     ) -> "List[Job]":
         if filter_tags is None:
@@ -390,6 +467,14 @@ class SessionBase(CreatableBalsamModel):
             app_ids=app_ids,
         )
 
+    def acquire_jobs_bulk(self, specs: List[Dict[str, Any]]) -> "List[List[Job]]":
+        """
+        Acquire Jobs for several `acquire_jobs` parameter sets in a single
+        API round-trip. Returns one list of Jobs per spec, in order.
+        """
+        specs = [{"filter_tags": {}, **spec} for spec in specs]
+        return self.__class__.objects._do_acquire_bulk(self, specs)
+
     def tick(self) -> None:
         return self.__class__.objects._do_tick(self)
 
@@ -404,8 +489,15 @@ class SessionManagerBase(Manager["Session"]):
         Job.objects = JobManager(client=self._client)
 
         acquired_raw = self._client.post(self._api_path + f"{instance.id}", **kwargs)
-        jobs = [Job._from_api(dat) for dat in acquired_raw]
-        return jobs
+        return Job._from_api_bulk(acquired_raw)
+
+    def _do_acquire_bulk(self, instance: "SessionBase", specs: List[Dict[str, Any]]) -> "List[List[Job]]":
+        from balsam._api.models import Job, JobManager
+
+        Job.objects = JobManager(client=self._client)
+
+        acquired_raw = self._client.bulk_post(self._api_path + f"{instance.id}/bulk", specs)
+        return [Job._from_api_bulk(spec_raw) for spec_raw in acquired_raw]
 
     def _do_tick(self, instance: "SessionBase") -> None:
         self._client.put(self._api_path + f"{instance.id}")
@@ -1,5 +1,5 @@
 import json
-from typing import TYPE_CHECKING, Any, Dict, Generic, Optional, Set, Tuple, Type, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar, cast
 
 import yaml
 from pydantic import BaseModel
@@ -130,6 +130,31 @@ class BalsamModel(metaclass=BalsamModelMeta):
     def _from_api(cls: Type[T], data: Any) -> T:
         return cls(_api_data=True, **data)
 
+    @classmethod
+    def _from_api_bulk(cls: Type[T], data_list: List[Dict[str, Any]]) -> List[T]:
+        """
+        Like _from_api, but skips pydantic validation of the (already
+        server-validated) API data. Fields that JSON cannot represent natively
+        are converted by _coerce_api_data. Keys that the read model does not
+        define are dropped, as validation would.
+        """
+        fields = cls._read_model_cls.__fields__
+        instances = []
+        for data in data_list:
+            instance = cls.__new__(cls)
+            instance._create_model = None
+            instance._update_model = None
+            coerced = cls._coerce_api_data({k: v for k, v in data.items() if k in fields})
+            instance._read_model = cls._read_model_cls.construct(**coerced)
+            instance._state = "clean"
+            instance._dirty_fields = set()
+            instances.append(instance)
+        return instances
+
+    @classmethod
+    def _coerce_api_data(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        return data
+
     def _refresh_from_dict(self, data: Dict[Any, Any]) -> None:
         self._read_model = self._read_model_cls(**data)
         self._set_clean()
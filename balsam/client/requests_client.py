@@ -4,13 +4,18 @@ import random
 import time
 from json import JSONDecodeError
 from pprint import pformat
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Type, Union, cast
 
 import requests
 
 from . import urls
 from .rest_base_client import RESTClient
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 OptionalAnyJSON = Optional[Union[Dict[str, Any], List[Any]]]
@@ -103,7 +108,7 @@ class RequestsClient(RESTClient):
                 self.backoff(exc)
             else:
                 try:
-                    return response.json()  # type: ignore
+                    return self._decode_json(response)
                 except (ValueError, JSONDecodeError):
                     if http_method != "DELETE":
                         raise
@@ -117,18 +122,32 @@ class RequestsClient(RESTClient):
         json: OptionalAnyJSON,
         data: OptionalAnyJSON,
     ) -> requests.Response:
+        headers = None
+        body: Union[OptionalAnyJSON, bytes] = data
+        if json is not None and orjson is not None:
+            body = orjson.dumps(json, option=orjson.OPT_NON_STR_KEYS)
+            json = None
+            headers = {"Content-Type": "application/json"}
         response = self.session.request(
             http_method,
             url=absolute_url,
             params=params,
             json=json,
-            data=data,
+            data=body,
+            headers=headers,
             timeout=(self.connect_timeout, self.read_timeout),
         )
         if response.status_code >= 400:
             self._raise_with_explanation(response)
         return response
 
+    @staticmethod
+    def _decode_json(response: requests.Response) -> OptionalAnyJSON:
+        """Decode with orjson when it is installed (it ships with the server extras)"""
+        if orjson is not None:
+            return cast(OptionalAnyJSON, orjson.loads(response.content))
+        return cast(OptionalAnyJSON, response.json())
+
     def _raise_with_explanation(self, response: requests.Response) -> None:
         """
         Add the API's informative error message to Requests' generic status Exception
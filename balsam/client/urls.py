@@ -3,3 +3,4 @@ DEVICE_LOGIN = "auth/device/login"
 DEVICE_TOKEN = "auth/device/token"
 PASSWORD_LOGIN = "auth/password/login"
 PASSWORD_REGISTER = "auth/password/register"
+PASSWORD_REGISTER_BULK = "auth/password/register_bulk"
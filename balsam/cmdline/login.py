@@ -1,9 +1,14 @@
 import getpass
+import json
+from typing import IO, Optional
 
 import click
 
 from balsam.client import NotAuthenticatedError, RequestsClient, urls
 from balsam.config import ClientSettings
+from balsam.schemas import MAX_USERS_PER_BULK_REGISTER
+
+from .utils import load_client
 
 
 def is_auth() -> bool:
@@ -48,14 +53,36 @@ def login(url: str, force: bool) -> None:
 
 
 @click.command()
-@click.option("-a", "--address", prompt="Balsam server address", help="Balsam server address")
-@click.option("-u", "--username", prompt="Balsam username", help="Balsam username")
-def register(address: str, username: str) -> None:
+@click.option("-a", "--address", help="Balsam server address")
+@click.option("-u", "--username", help="Balsam username")
+@click.option(
+    "--from-file",
+    "users_file",
+    type=click.File("r"),
+    help="JSON list of {username, password} objects to register (requires a stored admin login)",
+)
+def register(address: Optional[str], username: Optional[str], users_file: Optional[IO[str]]) -> None:
     """
     Register a new user account with Balsam server
+
+    1) Register one user interactively
+
+        balsam register -a https://balsam-dev.alcf.anl.gov -u myname
+
+    2) Register many users at once, as a server admin logged in with `balsam login`
+
+        balsam register --from-file users.json
     """
+    if users_file is not None:
+        register_from_file(users_file)
+        return
+
+    if address is None:
+        address = click.prompt("Balsam server address")
     settings = ClientSettings(api_root=address)
     client = settings.build_client()
+    if username is None:
+        username = click.prompt("Balsam username")
     password = getpass.getpass("Password:")
     conf_password = getpass.getpass("Confirm Password:")
     if password != conf_password:
@@ -63,3 +90,13 @@ def register(address: str, username: str) -> None:
 
     resp = client.post(urls.PASSWORD_REGISTER, username=username, password=password, authenticating=True)
     click.echo(f"Registration success! {resp}")
+
+
+def register_from_file(users_file: IO[str]) -> None:
+    users = json.load(users_file)
+    if not isinstance(users, list):
+        raise click.BadParameter("Expected a JSON list of users", param_hint="--from-file")
+    client = load_client()
+    for i in range(0, len(users), MAX_USERS_PER_BULK_REGISTER):
+        resp = client.post(urls.PASSWORD_REGISTER_BULK, users=users[i : i + MAX_USERS_PER_BULK_REGISTER])
+        click.echo(f"Registered {len(resp)} users: {', '.join(user['username'] for user in resp)}")
@@ -47,7 +47,7 @@ from .transfer import (
     TransferItemState,
     TransferItemUpdate,
 )
-from .user import UserCreate, UserOut
+from .user import MAX_USERS_PER_BULK_REGISTER, UserCreate, UserOut
 
 MAX_PAGE_SIZE = 100_000
 MAX_ITEMS_PER_BULK_OP = 5000
@@ -55,6 +55,7 @@ MAX_ITEMS_PER_BULK_OP = 5000
 __all__ = [
     "UserCreate",
     "UserOut",
+    "MAX_USERS_PER_BULK_REGISTER",
     "SiteCreate",
     "SiteUpdate",
     "SiteOut",
@@ -56,8 +56,8 @@ class JobOrdering(str, Enum):
     workdir_desc = "-workdir"
 
 
-RUNNABLE_STATES = {JobState.preprocessed, JobState.restart_ready}
-DONE_STATES = {JobState.job_finished, JobState.failed}
+RUNNABLE_STATES = frozenset({JobState.preprocessed, JobState.restart_ready})
+DONE_STATES = frozenset({JobState.job_finished, JobState.failed})
 
 
 class JobBase(BaseModel):
@@ -30,7 +30,7 @@ class SessionAcquire(BaseModel):
     max_aggregate_nodes: Optional[float]
     serial_only: bool = False
     filter_tags: Dict[str, str]
-    states: Set[JobState] = RUNNABLE_STATES
+    states: Set[JobState] = set(RUNNABLE_STATES)
     app_ids: Set[int] = set()
 
     @validator("max_num_jobs")
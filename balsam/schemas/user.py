@@ -1,5 +1,7 @@
 from pydantic import BaseModel
 
+MAX_USERS_PER_BULK_REGISTER = 100
+
 
 class UserCreate(BaseModel):
     username: str
@@ -1,11 +1,13 @@
 import logging
-from typing import Any, Dict
+from collections import Counter
+from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session, exc
 
-from balsam.schemas import UserCreate, UserOut
+from balsam.schemas import MAX_USERS_PER_BULK_REGISTER, UserCreate, UserOut
+from balsam.server import settings
 from balsam.server.models.crud import users
 
 from .db_sessions import get_admin_session
@@ -17,6 +19,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/password")
 
 
+def admin_from_token(user: UserOut = Depends(user_from_token)) -> UserOut:
+    if user.username not in settings.auth.admin_usernames:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required")
+    return user
+
+
 def authenticate_user_password(db: Session, username: str, password: str) -> UserOut:
     try:
         user = users.get_user_by_username(db, username)
@@ -59,3 +67,32 @@ def register(user: UserCreate, db: Session = Depends(get_admin_session)) -> User
     new_user = users.create_user(db, user.username, user.password)
     db.commit()
     return new_user
+
+
+@router.post("/register_bulk", response_model=List[UserOut], status_code=status.HTTP_201_CREATED)
+def register_bulk(
+    user_list: List[UserCreate] = Body(..., alias="users", embed=True),
+    admin: UserOut = Depends(admin_from_token),
+    db: Session = Depends(get_admin_session),
+) -> List[UserOut]:
+    """
+    Register several users in one request; either all are created or none.
+    Restricted to the usernames in `settings.auth.admin_usernames`.
+    """
+    if len(user_list) > MAX_USERS_PER_BULK_REGISTER:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot bulk-register more than {MAX_USERS_PER_BULK_REGISTER} users in a single API call.",
+        )
+    counts = Counter(user.username for user in user_list)
+    duplicates = sorted(name for name, count in counts.items() if count > 1)
+    if duplicates:
+        raise HTTPException(status_code=400, detail=f"Duplicate usernames in request: {duplicates}")
+    taken = users.existing_usernames(db, counts.keys())
+    if taken:
+        raise HTTPException(status_code=400, detail=f"Usernames already taken: {taken}")
+
+    new_users = [users.create_user(db, user.username, user.password) for user in user_list]
+    db.commit()
+    logger.info(f"Admin {admin.username} registered {len(new_users)} users")
+    return new_users
@@ -50,6 +50,7 @@ class AuthSettings(BaseSettings):
     token_ttl: timedelta = timedelta(hours=48)
     auth_method: str = "user_from_token"
     login_methods: List[LoginMethod] = [LoginMethod.password]
+    admin_usernames: List[str] = []
     oauth_provider: Optional[OAuthProviderSettings] = None
 
     @validator("oauth_provider", always=True)
@@ -2,7 +2,7 @@ from collections import defaultdict
 from datetime import datetime
 from itertools import chain
 from logging import getLogger
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy import Column, bindparam, func, insert, orm, select, update
@@ -17,6 +17,9 @@ from balsam.server.utils import Paginator
 
 logger = getLogger(__name__)
 
+# Rows per server-side cursor fetch when streaming Job listings
+JOB_STREAM_CHUNK_SIZE = 2000
+
 
 def owned_job_selector(owner: schemas.UserOut, columns: Optional[List[Column[Any]]] = None) -> Select:
     if columns is None:
@@ -67,6 +70,21 @@ def populate_transfers(app: models.App, transfers: Dict[str, JobTransferItem]) -
     return transfer_items
 
 
+def _filter_jobs(owner: schemas.UserOut, job_id: Optional[int], filterset: Optional[JobQuery]) -> Select:
+    stmt = owned_job_selector(owner)
+    if job_id is not None:
+        stmt = stmt.where(models.Job.id == job_id)
+    if filterset:
+        stmt = filterset.apply_filters(stmt)
+    return stmt
+
+
+def _count_and_paginate(db: Session, stmt: Select, paginator: Paginator[models.Job]) -> "Tuple[int, Select]":
+    count_q = stmt.with_only_columns([func.count(models.Job.id)]).order_by(None)
+    count = db.execute(count_q).scalar()
+    return count, paginator.paginate_core(stmt).order_by(models.Job.id)
+
+
 def fetch(
     db: Session,
     owner: schemas.UserOut,
@@ -74,21 +92,33 @@ def fetch(
     job_id: Optional[int] = None,
     filterset: Optional[JobQuery] = None,
 ) -> "Tuple[int, List[Dict[str, Any]]]":
-    stmt = owned_job_selector(owner)
-    if job_id is not None:
-        stmt = stmt.where(models.Job.id == job_id)
-    if filterset:
-        stmt = filterset.apply_filters(stmt)
+    stmt = _filter_jobs(owner, job_id, filterset)
     if paginator is None:
         job = db.execute(stmt).mappings().one()
         return 1, [dict(job)]
-    count_q = stmt.with_only_columns([func.count(models.Job.id)]).order_by(None)
-    count = db.execute(count_q).scalar()
-    stmt = paginator.paginate_core(stmt).order_by(models.Job.id)
+    count, stmt = _count_and_paginate(db, stmt, paginator)
     job_rows = [dict(j) for j in db.execute(stmt).mappings()]
     return count, job_rows
 
 
+def fetch_chunks(
+    db: Session,
+    owner: schemas.UserOut,
+    paginator: Paginator[models.Job],
+    filterset: Optional[JobQuery] = None,
+) -> "Tuple[int, Iterator[List[Dict[str, Any]]]]":
+    """
+    Like fetch(), but the page is read lazily through a server-side cursor
+    and yielded in chunks of JOB_STREAM_CHUNK_SIZE rows. Rows are zipped
+    with the column names directly, skipping per-row RowMapping objects.
+    """
+    count, stmt = _count_and_paginate(db, _filter_jobs(owner, None, filterset), paginator)
+    stmt = stmt.execution_options(yield_per=JOB_STREAM_CHUNK_SIZE)
+    result = db.execute(stmt)
+    keys = [str(key) for key in result.keys()]
+    return count, ([dict(zip(keys, row)) for row in part] for part in result.partitions())
+
+
 def bulk_create(
     db: Session, owner: schemas.UserOut, job_specs: List[schemas.ServerJobCreate]
 ) -> List[Dict[str, Any]]:
@@ -151,7 +151,25 @@ def acquire(
 ) -> List[Dict[str, Any]]:
     session = (owned_session_query(db, owner).filter(models.Session.id == session_id)).one()
     session.heartbeat = datetime.utcnow()
+    return _acquire_for_session(db, owner, session, spec)
 
+
+def bulk_acquire(
+    db: Session, owner: schemas.UserOut, session_id: int, specs: List[schemas.SessionAcquire]
+) -> List[List[Dict[str, Any]]]:
+    """
+    Acquire against several specs in one transaction. Jobs locked by an
+    earlier spec are already bound to the Session and cannot be re-acquired
+    by a later one.
+    """
+    session = (owned_session_query(db, owner).filter(models.Session.id == session_id)).one()
+    session.heartbeat = datetime.utcnow()
+    return [_acquire_for_session(db, owner, session, spec) for spec in specs]
+
+
+def _acquire_for_session(
+    db: Session, owner: schemas.UserOut, session: models.Session, spec: schemas.SessionAcquire
+) -> List[Dict[str, Any]]:
     logger.debug(f"Acquire: filtering for jobs with states: {spec.states}")
 
     # Select unlocked jobs at this Site matching the state / tags criteria
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, cast
+from typing import Iterable, List, Optional, cast
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -21,6 +21,11 @@ def user_exists(db: Session, username: str) -> bool:
     return bool(db.query(exists().where(User.username == username)).scalar())  # type: ignore
 
 
+def existing_usernames(db: Session, usernames: Iterable[str]) -> List[str]:
+    query = db.query(User.username).filter(User.username.in_(list(usernames)))
+    return sorted(cast(str, username) for (username,) in query)
+
+
 def create_user(db: Session, username: str, password: Optional[str]) -> UserOut:
     if password:
         hashed = get_hash(password)
@@ -1,11 +1,10 @@
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, Iterator, List
 
 import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy import orm
-from starlette.responses import Response
 
 from balsam import schemas
 from balsam.schemas import MAX_ITEMS_PER_BULK_OP
@@ -21,16 +20,26 @@ router = APIRouter()
 auth = get_auth_method()
 
 
-@router.get("/", response_class=Response)
+def _stream_page(count: int, job_chunks: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """Encode a paginated response body incrementally, one chunk of rows at a time."""
+    yield b'{"count":' + orjson.dumps(count) + b',"results":['
+    sep = b""
+    for chunk in job_chunks:
+        yield sep + b",".join(orjson.dumps(job) for job in chunk)
+        sep = b","
+    yield b"]}"
+
+
+@router.get("/", response_class=StreamingResponse)
 def list(
     db: orm.Session = Depends(get_webuser_session),
     user: schemas.UserOut = Depends(auth),
     paginator: Paginator[Job] = Depends(Paginator),
     q: JobQuery = Depends(JobQuery),
-) -> Response:
+) -> StreamingResponse:
     """List the user's Jobs."""
-    count, jobs = crud.jobs.fetch(db, owner=user, paginator=paginator, filterset=q)
-    return Response(content=orjson.dumps({"count": count, "results": jobs}), media_type="application/json")
+    count, job_chunks = crud.jobs.fetch_chunks(db, owner=user, paginator=paginator, filterset=q)
+    return StreamingResponse(_stream_page(count, job_chunks), media_type="application/json")
 
 
 @router.get("/{job_id}", response_class=ORJSONResponse)
@@ -1,10 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import ORJSONResponse
 from sqlalchemy import orm
 
 from balsam import schemas
+from balsam.schemas import MAX_ITEMS_PER_BULK_OP
 from balsam.server.auth import get_auth_method, get_webuser_session
 from balsam.server.models import crud
 from balsam.server.pubsub import pubsub
@@ -52,6 +53,23 @@ def acquire(
     return ORJSONResponse(content=acquired_jobs)
 
 
+@router.post("/{session_id}/bulk", response_class=ORJSONResponse)
+def bulk_acquire(
+    session_id: int,
+    specs: List[schemas.SessionAcquire],
+    db: orm.Session = Depends(get_webuser_session),
+    user: schemas.UserOut = Depends(auth),
+) -> ORJSONResponse:
+    """Acquire Jobs for a list of acquisition specs in a single request."""
+    if sum(spec.max_num_jobs for spec in specs) > MAX_ITEMS_PER_BULK_OP:
+        raise HTTPException(
+            status_code=400, detail=f"Cannot bulk-acquire more than {MAX_ITEMS_PER_BULK_OP} in a single API call."
+        )
+    acquired_jobs = crud.sessions.bulk_acquire(db, owner=user, session_id=session_id, specs=specs)
+    db.commit()
+    return ORJSONResponse(content=acquired_jobs)
+
+
 @router.put("/{session_id}")
 def tick(
     session_id: int, db: orm.Session = Depends(get_webuser_session), user: schemas.UserOut = Depends(auth)
@@ -1,14 +1,17 @@
 import logging
+import multiprocessing
 import queue
 import threading
 import time
+from collections import deque
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, AbstractSet, Any, Deque, Dict, List, Optional, Set
 
-from balsam.schemas import MAX_JOBS_PER_SESSION_ACQUIRE, JobState
+from balsam.schemas import MAX_ITEMS_PER_BULK_OP, MAX_JOBS_PER_SESSION_ACQUIRE, RUNNABLE_STATES, JobState
 from balsam.util import Process, SigHandler
 
 from .util import Queue
+from .util.mp_queue import SharedCounter
 
 if TYPE_CHECKING:
     from balsam._api.models import Job, Session  # noqa: F401
@@ -42,13 +45,17 @@ class SessionThread(threading.Thread):
                     "The run will still work, but Jobs will not be associated with a BatchJob."
                 )
         self.session = client.Session.objects.create(site_id=site_id, batch_job_id=batch_job_id)
+        self._exit_event = threading.Event()
 
     def run(self) -> None:
-        while True:
+        while not self._exit_event.is_set():
             if self.session.id is not None:
                 self.session.tick()
                 logger.debug("Ticked session")
-            time.sleep(self.TICK_PERIOD.total_seconds())
+            self._exit_event.wait(timeout=self.TICK_PERIOD.total_seconds())
+
+    def terminate(self) -> None:
+        self._exit_event.set()
 
 
 class FixedDepthJobSource(Process):
@@ -62,25 +69,42 @@ class FixedDepthJobSource(Process):
     resources, launchers using this JobSource may prefetch too much and
     prevent effective work-sharing (i.e. one launcher hogs all the jobs in
     its queue, leaving the other launchers empty-handed).
+
+    Consumers wake the refill loop early when they run short, but after an
+    acquire that comes up short the loop waits `REFILL_INTERVAL` seconds
+    before asking the API again.
+
+    Acquired jobs are sent to consumers in lists of up to `chunk_size` jobs
+    per queue message. A chunk is never split between consumer processes, so
+    `chunk_size` > 1 should only be used with a single consuming process.
     """
 
+    REFILL_INTERVAL = 1.0
+
     def __init__(
         self,
         client: "RESTClient",
         site_id: int,
         prefetch_depth: int,
         filter_tags: Optional[Dict[str, str]] = None,
-        states: Set[str] = {"PREPROCESSED", "RESTART_READY"},
+        states: AbstractSet[str] = RUNNABLE_STATES,
         serial_only: bool = False,
         max_wall_time_min: Optional[int] = None,
         max_nodes_per_job: Optional[int] = None,
         max_aggregate_nodes: Optional[float] = None,
         scheduler_id: Optional[int] = None,
         app_ids: Optional[Set[int]] = None,
+        chunk_size: int = 1,
     ) -> None:
         super().__init__()
-        self.queue: "Queue[Job]" = Queue()
+        self.queue: "Queue[List[Job]]" = Queue()
         self.prefetch_depth = prefetch_depth
+        self.chunk_size = max(1, chunk_size)
+        # Number of jobs (not chunks) held by the queue and consumer buffers
+        self._num_queued = SharedCounter(0)
+        self._buffer: Deque["Job"] = deque()
+        # Set by consumers when the queue runs low, to wake the refill loop early
+        self.refill_needed = multiprocessing.Event()
 
         self.client = client
         self.site_id = site_id
@@ -97,21 +121,35 @@ class FixedDepthJobSource(Process):
         self.start_time = time.time()
 
     def get_jobs(self, max_num_jobs: int) -> List["Job"]:
-        fetched = []
-        for _ in range(max_num_jobs):
-            try:
-                job = self.queue.get_nowait()
-                job.objects = self.client.Job.objects
-                fetched.append(job)
-            except queue.Empty:
-                break
+        if len(self._buffer) < max_num_jobs:
+            for chunk in self.queue.drain(max_num_jobs - len(self._buffer)):
+                self._buffer.extend(chunk)
+        num_fetched = min(max_num_jobs, len(self._buffer))
+        fetched = [self._buffer.popleft() for _ in range(num_fetched)]
+        self._num_queued.increment(-num_fetched)
+        if num_fetched < max_num_jobs or self._is_low():
+            self.refill_needed.set()
+        for job in fetched:
+            job.objects = self.client.Job.objects
         return fetched
 
     def get(self, timeout: Optional[float] = None) -> "Job":
-        job = self.queue.get(block=True, timeout=timeout)
+        if not self._buffer:
+            try:
+                self._buffer.extend(self.queue.get(block=True, timeout=timeout))
+            except queue.Empty:
+                self.refill_needed.set()
+                raise
+        job = self._buffer.popleft()
+        self._num_queued.increment(-1)
+        if self._is_low():
+            self.refill_needed.set()
         job.objects = self.client.Job.objects
         return job
 
+    def _is_low(self) -> bool:
+        return self._num_queued.value < self.prefetch_depth // 2
+
     def _run(self) -> None:
         sig_handler = SigHandler()
         self.client.close_session()
@@ -125,26 +163,65 @@ class FixedDepthJobSource(Process):
 
         assert self.session is not None
 
-        while not sig_handler.wait_until_exit(timeout=1):
-            qsize = self.queue.qsize()
+        last_refill = time.monotonic() - self.REFILL_INTERVAL
+        came_up_short = False
+        while not sig_handler.is_set():
+            since_refill = time.monotonic() - last_refill
+            if came_up_short and since_refill < self.REFILL_INTERVAL:
+                sig_handler.wait_until_exit(self.REFILL_INTERVAL - since_refill)
+                continue
+            # refill_needed is not woken by signals: short waits keep SIGTERM handling prompt
+            if not self.refill_needed.wait(timeout=0.1) and since_refill < self.REFILL_INTERVAL:
+                continue
+            if sig_handler.is_set():
+                break
+            self.refill_needed.clear()
+            last_refill = time.monotonic()
+            qsize = self._num_queued.value
             fetch_count = max(0, self.prefetch_depth - qsize)
-            fetch_count = min(fetch_count, MAX_JOBS_PER_SESSION_ACQUIRE)
+            fetch_count = min(fetch_count, self._max_fetch_count())
             logger.debug(f"JobSource queue depth is currently {qsize}. Fetching {fetch_count} more")
+            came_up_short = False
             if fetch_count:
-                params = self._get_acquire_parameters(fetch_count)
-                jobs = self.session.acquire_jobs(**params)
+                jobs = self._acquire(fetch_count)
+                came_up_short = len(jobs) < fetch_count
                 if jobs:
                     logger.debug(
                         f"Acquired from session {self.session.id} (batch_job_id {self.session.batch_job_id})"
                     )
                     logger.info(f"JobSource acquired {len(jobs)} jobs:")
-                for job in jobs:
-                    self.queue.put_nowait(job)
+                self._num_queued.increment(len(jobs))
+                for i in range(0, len(jobs), self.chunk_size):
+                    self.queue.put_nowait(jobs[i : i + self.chunk_size])
         logger.info("Signal: JobSource cancelling tick thread and deleting API Session")
+        self.session_thread.terminate()
         self.queue.cancel_join_thread()
         self.session.delete()
         logger.info("JobSource exit graceful")
 
+    def _max_fetch_count(self) -> int:
+        # Every bulk acquire spec gets the full max_aggregate_nodes budget,
+        # so a node-bounded refill must stay within a single acquire
+        if self.max_aggregate_nodes is not None:
+            return MAX_JOBS_PER_SESSION_ACQUIRE
+        return MAX_ITEMS_PER_BULK_OP
+
+    def _acquire(self, fetch_count: int) -> List["Job"]:
+        """
+        Refills larger than the per-acquire limit are split into several
+        acquisition specs and sent together in a single bulk request.
+        """
+        assert self.session is not None
+        if fetch_count <= MAX_JOBS_PER_SESSION_ACQUIRE:
+            return self.session.acquire_jobs(**self._get_acquire_parameters(fetch_count))
+
+        specs = []
+        while fetch_count > 0:
+            num_jobs = min(fetch_count, MAX_JOBS_PER_SESSION_ACQUIRE)
+            specs.append(self._get_acquire_parameters(num_jobs))
+            fetch_count -= num_jobs
+        return [job for spec_jobs in self.session.acquire_jobs_bulk(specs) for job in spec_jobs]
+
     def _get_acquire_parameters(self, num_jobs: int) -> Dict[str, Any]:
         request_time: Optional[float]
         if self.max_wall_time_min:
@@ -180,7 +257,7 @@ class SynchronousJobSource(object):
         client: "RESTClient",
         site_id: int,
         filter_tags: Optional[Dict[str, str]] = None,
-        states: Set[JobState] = {JobState.preprocessed, JobState.restart_ready},
+        states: AbstractSet[JobState] = RUNNABLE_STATES,
         serial_only: bool = False,
         max_wall_time_min: Optional[int] = None,
         scheduler_id: Optional[int] = None,
@@ -205,6 +282,7 @@ class SynchronousJobSource(object):
 
     def terminate(self) -> None:
         logger.info("Signal: JobSource cancelling tick thread and deleting API Session")
+        self.session_thread.terminate()
         self.session.delete()
         logger.info("JobSource exit graceful")
 
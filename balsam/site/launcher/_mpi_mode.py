@@ -169,18 +169,18 @@ class Launcher:
                 )
                 self.active_runs[job.id] = run
 
-    def check_run(self, run: "AppRun") -> Dict[str, Any]:
+    def check_run(self, run: "AppRun", now: datetime) -> Dict[str, Any]:
         retcode = run.poll()
         if retcode is None:
             return {"state": "RUNNING"}
         elif retcode == 0:
-            return {"state": "RUN_DONE", "state_timestamp": datetime.utcnow()}
+            return {"state": "RUN_DONE", "state_timestamp": now}
         else:
             tail = run.tail_output(nlines=self.error_tail_num_lines)
             logger.info(f"Run error: {tail}")
             return {
                 "state": "RUN_ERROR",
-                "state_timestamp": datetime.utcnow(),
+                "state_timestamp": now,
                 "state_data": {"returncode": retcode, "error": tail},
             }
 
@@ -196,11 +196,12 @@ class Launcher:
 
     def update_states(self, timeout: bool = False) -> None:
         remaining_runs = {}
+        now = datetime.utcnow()
         for id, run in self.active_runs.items():
-            status = self.check_run(run)
+            status = self.check_run(run, now)
             if status["state"] == "RUNNING" and timeout:
                 run.terminate()
-                self.status_updater.put(id, state=JobState.run_timeout, state_timestamp=datetime.utcnow())
+                self.status_updater.put(id, state=JobState.run_timeout, state_timestamp=now)
                 self.node_manager.free(id)
                 remaining_runs[id] = run
             elif status["state"] == "RUNNING":
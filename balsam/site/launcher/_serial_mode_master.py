@@ -9,7 +9,7 @@ import zmq
 
 from balsam._api.app import ApplicationDefinition
 from balsam.config import SiteConfig
-from balsam.schemas import DeserializeError, JobState
+from balsam.schemas import MAX_JOBS_PER_SESSION_ACQUIRE, DeserializeError, JobState
 from balsam.site import BulkStatusUpdater, FixedDepthJobSource
 from balsam.site.launcher.util import countdown_timer_min
 from balsam.util import SigHandler
@@ -238,6 +238,7 @@ def master_main(wall_time_min: int, master_port: int, log_filename: str, num_wor
         scheduler_id=scheduler_id,
         serial_only=True,
         max_nodes_per_job=1,
+        chunk_size=MAX_JOBS_PER_SESSION_ACQUIRE,
     )
     status_updater = BulkStatusUpdater(site_config.client)
 
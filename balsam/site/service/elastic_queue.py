@@ -78,7 +78,7 @@ class ElasticQueueService(BalsamService):
 
         tags = [f"{k}:{v}" for k, v in self.filter_tags.items()] if self.filter_tags else None
         running_jobs = Job.objects.filter(site_id=self.site_id, state=JobState.running, tags=tags)
-        runnable_jobs = Job.objects.filter(site_id=self.site_id, state=RUNNABLE_STATES, tags=tags)
+        runnable_jobs = Job.objects.filter(site_id=self.site_id, state=set(RUNNABLE_STATES), tags=tags)
         running_num_nodes = sum(float(job.num_nodes) / job.node_packing_count for job in running_jobs)
         runnable_num_nodes = sum(float(job.num_nodes) / job.node_packing_count for job in runnable_jobs)
 
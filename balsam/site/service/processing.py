@@ -22,8 +22,10 @@ PathLike = Union[str, Path]
 
 @contextmanager
 def job_context(workdir: Path, stdout_filename: str) -> Iterator[None]:
-    old_stdout = sys.stdout
-    old_stderr = sys.stderr
+    """
+    Run in `workdir` with fds 1 and 2 redirected to the stdout file, so that
+    output from subprocesses spawned by the App hooks is captured as well.
+    """
     old_cwd = os.getcwd()
     try:
         os.chdir(workdir)
@@ -31,15 +33,23 @@ def job_context(workdir: Path, stdout_filename: str) -> Iterator[None]:
         workdir.mkdir(parents=True, exist_ok=True)
         os.chdir(workdir)
 
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_stdout_fd, saved_stderr_fd = os.dup(1), os.dup(2)
     try:
-        with open(workdir.joinpath(stdout_filename), "a") as fp:
-            sys.stdout = fp
-            sys.stderr = fp
-            yield
+        fd = os.open(workdir.joinpath(stdout_filename), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+        os.close(fd)
+        yield
     finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_stdout_fd, 1)
+        os.dup2(saved_stderr_fd, 2)
+        os.close(saved_stdout_fd)
+        os.close(saved_stderr_fd)
         os.chdir(old_cwd)
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
 
 
 def transition_state(app: ApplicationDefinition) -> None:
@@ -6,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Type
 
+from balsam._api.bases import BatchJobValidationCtx
 from balsam.platform.scheduler import (
     SchedulerDeleteError,
     SchedulerError,
@@ -43,8 +44,9 @@ class SchedulerService(BalsamService):
         self.site_id = site_id
         self.scheduler = scheduler_class()
         self.allowed_queues = allowed_queues
-        self.allowed_projects = allowed_projects
-        self.optional_batch_job_params = optional_batch_job_params
+        self.validation_ctx = BatchJobValidationCtx.from_site_settings(
+            allowed_queues, allowed_projects, optional_batch_job_params
+        )
         self.job_template = ScriptTemplate(job_template_path)
         self.submit_directory = submit_directory
         self.username = getpass.getuser()
@@ -57,11 +59,7 @@ class SchedulerService(BalsamService):
 
     def submit_launch(self, job: "BatchJob", scheduler_jobs: Dict[int, SchedulerJobStatus]) -> None:
         try:
-            job.validate(
-                self.allowed_queues,
-                self.allowed_projects,
-                self.optional_batch_job_params,
-            )
+            job.validate(self.validation_ctx)
         except ValueError as e:
             return self.fail_submit(job, str(e))
 
@@ -1,6 +1,7 @@
 import multiprocessing
 from multiprocessing.queues import Queue as QueueBase
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+from multiprocessing.reduction import ForkingPickler
+from typing import TYPE_CHECKING, Any, Generic, List, TypeVar, cast
 
 # The following implementation of custom MyQueue to avoid NotImplementedError
 # when calling queue.qsize() in MacOS X comes almost entirely from this github
@@ -46,7 +47,33 @@ else:
         pass
 
 
-class _FallbackQueue(_QueueBase[T]):
+class _DrainableQueue(_QueueBase[T]):
+    """A multiprocessing.Queue that can drain several items at once.
+    Each get_nowait() acquires and releases the reader lock; drain() holds the
+    lock once while pulling every item currently available in the pipe.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(ctx=multiprocessing.get_context())
+
+    def drain(self, max_items: int) -> List[T]:
+        """Non-blocking get of up to max_items under a single lock acquire"""
+        if self._closed:  # type: ignore
+            raise ValueError(f"Queue {self!r} is closed")
+        payloads: List[bytes] = []
+        # Like get_nowait(): don't wait on a consumer blocked in get(timeout=...)
+        if not self._rlock.acquire(block=False):  # type: ignore
+            return []
+        try:
+            while len(payloads) < max_items and self._poll():  # type: ignore
+                payloads.append(self._recv_bytes())  # type: ignore
+                self._sem.release()  # type: ignore
+        finally:
+            self._rlock.release()  # type: ignore
+        return [ForkingPickler.loads(buf) for buf in payloads]
+
+
+class _FallbackQueue(_DrainableQueue[T]):
     """A portable implementation of multiprocessing.Queue.
     Because of multithreading / multiprocessing semantics, Queue.qsize() may
     raise the NotImplementedError exception on Unix platforms like Mac OS X
@@ -59,7 +86,7 @@ class _FallbackQueue(_QueueBase[T]):
     """
 
     def __init__(self) -> None:
-        super().__init__(ctx=multiprocessing.get_context())
+        super().__init__()
         self.size = SharedCounter(0)
 
     def put(self, *args: Any, **kwargs: Any) -> None:
@@ -71,6 +98,11 @@ class _FallbackQueue(_QueueBase[T]):
         self.size.increment(-1)
         return result
 
+    def drain(self, max_items: int) -> List[T]:
+        result = super().drain(max_items)
+        self.size.increment(-len(result))
+        return result
+
     def qsize(self) -> int:
         """Reliable implementation of multiprocessing.Queue.qsize()"""
         return self.size.value
@@ -85,4 +117,4 @@ try:
 except NotImplementedError:
     Queue = _FallbackQueue
 else:
-    Queue = multiprocessing.Queue  # type: ignore
+    Queue = _DrainableQueue  # type: ignore
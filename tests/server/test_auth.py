@@ -1,8 +1,11 @@
 from uuid import uuid4
 
+import pytest
 from fastapi import status
 
+import balsam.server
 from balsam.client import urls
+from balsam.schemas import MAX_USERS_PER_BULK_REGISTER
 
 
 def test_unauth_user_cannot_view_sites(anon_client):
@@ -19,3 +22,36 @@ def test_register(anon_client):
 def test_auth_user_can_view_sites(auth_client):
     resp = auth_client.get("/sites/")
     assert resp["results"] == []
+
+
+@pytest.fixture(scope="function")
+def admin_client(auth_client, monkeypatch):
+    username = auth_client.get("/auth/password/me")["username"]
+    monkeypatch.setattr(balsam.server.settings.auth, "admin_usernames", [username])
+    return auth_client
+
+
+def test_register_bulk(admin_client):
+    new_users = [{"username": f"user{uuid4()}", "password": "foo"} for _ in range(3)]
+    resp = admin_client.post("/" + urls.PASSWORD_REGISTER_BULK, users=new_users)
+    assert [user["username"] for user in resp] == [user["username"] for user in new_users]
+    assert all(isinstance(user["id"], int) for user in resp)
+
+
+def test_register_bulk_requires_admin(anon_client, auth_client):
+    new_users = [{"username": f"user{uuid4()}", "password": "foo"}]
+    anon_client.post("/" + urls.PASSWORD_REGISTER_BULK, users=new_users, check=status.HTTP_401_UNAUTHORIZED)
+    auth_client.post("/" + urls.PASSWORD_REGISTER_BULK, users=new_users, check=status.HTTP_403_FORBIDDEN)
+
+
+def test_register_bulk_is_capped(admin_client):
+    new_users = [{"username": f"user{uuid4()}", "password": "foo"} for _ in range(MAX_USERS_PER_BULK_REGISTER + 1)]
+    admin_client.post("/" + urls.PASSWORD_REGISTER_BULK, users=new_users, check=status.HTTP_400_BAD_REQUEST)
+
+
+def test_register_bulk_is_all_or_nothing(anon_client, admin_client):
+    existing = {"username": f"user{uuid4()}", "password": "foo"}
+    anon_client.post("/" + urls.PASSWORD_REGISTER, **existing)
+    fresh = {"username": f"user{uuid4()}", "password": "foo"}
+    admin_client.post("/" + urls.PASSWORD_REGISTER_BULK, users=[fresh, existing], check=status.HTTP_400_BAD_REQUEST)
+    anon_client.post("/" + urls.PASSWORD_REGISTER, **fresh)
@@ -271,6 +271,27 @@ def test_acquire_for_launch(auth_client, job_dict, create_session):
         assert job["batch_job_id"] == session2.batch_job_id
 
 
+def test_bulk_acquire(auth_client, job_dict, create_session):
+    jobs = auth_client.bulk_post("/jobs/", [job_dict(transfers={}) for _ in range(10)])
+    auth_client.bulk_put("/jobs/", {"state": "PREPROCESSED"}, id=[j["id"] for j in jobs])
+    session = create_session()
+
+    # One request carries two specs; the second cannot re-acquire jobs locked by the first
+    acquired = auth_client.bulk_post(
+        f"/sessions/{session.id}/bulk",
+        [
+            {"filter_tags": {}, "max_num_jobs": 4},
+            {"filter_tags": {}, "max_num_jobs": 100},
+        ],
+        check=status.HTTP_200_OK,
+    )
+    assert len(acquired) == 2
+    assert len(acquired[0]) == 4
+    assert len(acquired[1]) == 6
+    ids = [job["id"] for spec_jobs in acquired for job in spec_jobs]
+    assert sorted(ids) == sorted(j["id"] for j in jobs)
+
+
 def test_update_to_running_does_not_release_lock(auth_client, job_dict, create_session, db_session):
     jobs = auth_client.bulk_post("/jobs/", [job_dict(transfers={}) for _ in range(10)])
 
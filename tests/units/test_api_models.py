@@ -0,0 +1,100 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from balsam._api.bases import BatchJobValidationCtx
+from balsam._api.models import BatchJob, Job, Session, SessionManager
+from balsam.schemas import AllowedQueue, JobState
+
+
+def api_job_dict(id):
+    return {
+        "id": id,
+        "app_id": 1,
+        "workdir": f"test/{id}",
+        "tags": {"system": "H2O"},
+        "data": {},
+        "return_code": None,
+        "num_nodes": 1,
+        "ranks_per_node": 1,
+        "threads_per_rank": 1,
+        "threads_per_core": 1,
+        "launch_params": {},
+        "gpus_per_rank": 0,
+        "node_packing_count": 1,
+        "wall_time_min": 0,
+        "parent_ids": [3, 4],
+        "batch_job_id": None,
+        "last_update": "2021-06-01T12:30:00.123456",
+        "state": "PREPROCESSED",
+        "pending_file_cleanup": True,
+        "serialized_parameters": "",
+        "serialized_return_value": "",
+        "serialized_exception": "",
+        # Acquire responses carry the whole jobs row, including non-JobOut columns
+        "session_id": 7,
+    }
+
+
+def test_from_api_bulk_matches_validated_jobs():
+    raw = [api_job_dict(i) for i in range(3)]
+    bulk = Job._from_api_bulk(raw)
+    validated = [Job._from_api(dat) for dat in raw]
+    assert bulk == validated
+    assert bulk[0].display_dict() == validated[0].display_dict()
+
+    job = bulk[0]
+    assert job.workdir == Path("test/0")
+    assert job.parent_ids == {3, 4}
+    assert job.state == JobState.preprocessed
+    assert job.last_update == datetime(2021, 6, 1, 12, 30, 0, 123456)
+
+
+def test_batch_job_validation_ctx_matches_site_settings():
+    queues = {"debug": AllowedQueue(max_nodes=8, max_walltime=60, max_queued_jobs=2)}
+    ctx = BatchJobValidationCtx.from_site_settings(queues, {"proj"}, {"extra": "no"})
+    job = BatchJob(
+        site_id=1,
+        num_nodes=2,
+        wall_time_min=30,
+        queue="debug",
+        project="proj",
+        job_mode="mpi",
+        optional_params={"extra": "yes"},
+    )
+    job.validate(ctx)
+    job.validate(queues, {"proj"}, {"extra": "no"})
+    job.validate(allowed_queues=queues, allowed_projects=["proj"], optional_batch_job_params={"extra": "no"})
+
+    job.optional_params = {"bogus": "yes"}
+    with pytest.raises(ValueError, match="Extraneous"):
+        job.validate(ctx)
+    job.optional_params = {}
+    job.project = "other"
+    with pytest.raises(ValueError, match="Unknown project"):
+        job.validate(ctx)
+
+
+class StubClient:
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def bulk_post(self, url, list_data):
+        self.requests.append((url, list_data))
+        return self.response
+
+
+def test_session_acquire_jobs_bulk():
+    client = StubClient([[api_job_dict(1), api_job_dict(2)], [], [api_job_dict(3)]])
+    SessionManager(client)
+    session = Session._from_api({"id": 7, "site_id": 1, "batch_job_id": None, "heartbeat": datetime.utcnow()})
+
+    specs = [{"max_num_jobs": 2}, {"max_num_jobs": 1, "filter_tags": {"system": "H2O"}}, {"max_num_jobs": 1}]
+    acquired = session.acquire_jobs_bulk(specs)
+
+    url, sent_specs = client.requests[0]
+    assert url == "sessions/7/bulk"
+    assert [spec["filter_tags"] for spec in sent_specs] == [{}, {"system": "H2O"}, {}]
+    assert [[job.id for job in jobs] for jobs in acquired] == [[1, 2], [], [3]]
@@ -0,0 +1,121 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from balsam.schemas import MAX_JOBS_PER_SESSION_ACQUIRE
+from balsam.site.job_source import FixedDepthJobSource
+from balsam.util import SigHandler
+
+
+class StubJob:
+    def __init__(self, id):
+        self.id = id
+
+
+class StubSession:
+    id = 1
+    batch_job_id = None
+
+    def __init__(self, jobs=()):
+        self.jobs = list(jobs)
+        self.num_acquires = 0
+
+    def acquire_jobs(self, max_num_jobs, **kwargs):
+        self.num_acquires += 1
+        acquired, self.jobs = self.jobs[:max_num_jobs], self.jobs[max_num_jobs:]
+        return acquired
+
+    def acquire_jobs_bulk(self, specs):
+        self.bulk_specs = specs
+        return [self.acquire_jobs(**spec) for spec in specs]
+
+    def delete(self):
+        pass
+
+
+@pytest.fixture
+def make_job_source():
+    def _make(session, **kwargs):
+        client = SimpleNamespace(close_session=lambda: None, Job=SimpleNamespace(objects=None))
+        job_source = FixedDepthJobSource(client=client, site_id=1, **kwargs)
+        job_source.session = session
+        job_source.session_thread = SimpleNamespace(terminate=lambda: None)
+        return job_source
+
+    yield _make
+    SigHandler._exit_event.clear()
+
+
+def run_for(job_source, seconds):
+    """Run the refill loop in this (main) thread until a timer signals exit"""
+    timer = threading.Timer(seconds, SigHandler.set)
+    timer.start()
+    job_source._run()
+    timer.join()
+
+
+def test_short_acquire_backs_off(make_job_source):
+    session = StubSession()
+    job_source = make_job_source(session, prefetch_depth=10)
+    job_source.REFILL_INTERVAL = 0.2
+    done = threading.Event()
+
+    def impatient_consumer():
+        while not done.is_set():
+            job_source.refill_needed.set()
+            time.sleep(0.005)
+
+    consumer = threading.Thread(target=impatient_consumer)
+    consumer.start()
+    try:
+        run_for(job_source, 1.0)
+    finally:
+        done.set()
+        consumer.join()
+    assert 3 <= session.num_acquires <= 7
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3])
+def test_queued_jobs_are_returned_in_order(make_job_source, chunk_size):
+    session = StubSession(StubJob(i) for i in range(7))
+    job_source = make_job_source(session, prefetch_depth=10, chunk_size=chunk_size)
+    run_for(job_source, 0.3)
+    assert job_source._num_queued.value == 7
+
+    fetched = [job_source.get(timeout=5.0), *job_source.get_jobs(2)]
+    deadline = time.monotonic() + 5.0
+    while len(fetched) < 7:
+        assert time.monotonic() < deadline
+        fetched.extend(job_source.get_jobs(7 - len(fetched)))
+
+    assert [job.id for job in fetched] == list(range(7))
+    assert job_source._num_queued.value == 0
+    assert job_source.get_jobs(5) == []
+    assert job_source.refill_needed.is_set()
+
+
+def test_large_refill_is_split_into_bulk_specs(make_job_source):
+    num_jobs = 2 * MAX_JOBS_PER_SESSION_ACQUIRE + 100
+    session = StubSession(StubJob(i) for i in range(num_jobs))
+    job_source = make_job_source(session, prefetch_depth=num_jobs)
+
+    jobs = job_source._acquire(num_jobs)
+    assert [job.id for job in jobs] == list(range(num_jobs))
+    assert [spec["max_num_jobs"] for spec in session.bulk_specs] == [
+        MAX_JOBS_PER_SESSION_ACQUIRE,
+        MAX_JOBS_PER_SESSION_ACQUIRE,
+        100,
+    ]
+
+
+def test_aggregate_node_budget_is_not_split(make_job_source):
+    num_jobs = 2 * MAX_JOBS_PER_SESSION_ACQUIRE + 100
+    session = StubSession(StubJob(i) for i in range(num_jobs))
+    job_source = make_job_source(session, prefetch_depth=num_jobs, max_aggregate_nodes=4.0)
+
+    run_for(job_source, 0.3)
+    assert session.num_acquires == 1
+    assert not hasattr(session, "bulk_specs")
+    assert job_source._num_queued.value == MAX_JOBS_PER_SESSION_ACQUIRE
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from balsam.site.util import Queue
+from balsam.site.util.mp_queue import _FallbackQueue
+
+
+def drain_until(q, num_items, max_items, timeout=5.0):
+    """Drain repeatedly, since the feeder thread flushes puts into the pipe asynchronously"""
+    deadline = time.monotonic() + timeout
+    items = []
+    while len(items) < num_items:
+        assert time.monotonic() < deadline, f"Timed out with {len(items)}/{num_items} items"
+        batch = q.drain(max_items)
+        assert len(batch) <= max_items
+        items.extend(batch)
+    return items
+
+
+@pytest.mark.parametrize("queue_cls", [Queue, _FallbackQueue])
+def test_drain_respects_max_items(queue_cls):
+    q = queue_cls()
+    for i in range(10):
+        q.put_nowait(i)
+
+    assert drain_until(q, 10, max_items=4) == list(range(10))
+    assert q.drain(100) == []
+    assert q.qsize() == 0
+
+
+@pytest.mark.parametrize("queue_cls", [Queue, _FallbackQueue])
+def test_drain_does_not_wait_on_reader_lock(queue_cls):
+    q = queue_cls()
+    q.put_nowait(1)
+    # Stand in for another consumer blocked in get(timeout=...)
+    q._rlock.acquire()
+    try:
+        start = time.monotonic()
+        assert q.drain(10) == []
+        assert time.monotonic() - start < 1.0
+    finally:
+        q._rlock.release()
+    assert drain_until(q, 1, max_items=10) == [1]
@@ -0,0 +1,16 @@
+import os
+import subprocess
+
+from balsam.site.service.processing import job_context
+
+
+def test_job_context_redirects_child_output(tmp_path):
+    cwd = os.getcwd()
+    workdir = tmp_path / "job"
+    with job_context(workdir, "balsam.log"):
+        assert os.getcwd() == str(workdir)
+        subprocess.run(["echo", "hello from child"], check=True)
+        os.write(2, b"stderr line\n")
+
+    assert os.getcwd() == cwd
+    assert workdir.joinpath("balsam.log").read_text() == "hello from child\nstderr line\n"